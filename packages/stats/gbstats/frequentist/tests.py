@@ -1,10 +1,12 @@
 from abc import abstractmethod
-from dataclasses import asdict
-from typing import Optional, List
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache, partial
+import math
+from typing import Callable, Optional, List, Sequence
 
 import numpy as np
-from pydantic.dataclasses import dataclass
-from scipy.stats import t
+from scipy.optimize import brentq
+from scipy.special import stdtr, stdtrit
 
 from gbstats.messages import (
     BASELINE_VARIATION_ZERO_MESSAGE,
@@ -55,6 +57,25 @@ class PValueResult:
     p_value_error_message: Optional[PValueErrorMessage] = None
 
 
+def frequentist_default_output(
+    error_message: Optional[str] = None,
+    p_value_error_message: Optional[PValueErrorMessage] = None,
+) -> FrequentistTestResult:
+    """Uninformative result for when a frequentist test can't be performed"""
+    return FrequentistTestResult(
+        expected=0.0,
+        ci=[0.0, 0.0],
+        p_value=1.0,
+        uplift=Uplift(
+            dist="normal",
+            mean=0.0,
+            stddev=0.0,
+        ),
+        error_message=error_message,
+        p_value_error_message=p_value_error_message,
+    )
+
+
 def frequentist_diff(mean_a, mean_b, relative, mean_a_unadjusted=None) -> float:
     if not mean_a_unadjusted:
         mean_a_unadjusted = mean_a
@@ -65,62 +86,85 @@ def frequentist_diff(mean_a, mean_b, relative, mean_a_unadjusted=None) -> float:
 
 
 def frequentist_variance(var_a, mean_a, n_a, var_b, mean_b, n_b, relative) -> float:
+    var_mean_a = var_a / n_a
+    var_mean_b = var_b / n_b
     if relative:
-        return variance_of_ratios(mean_b, var_b / n_b, mean_a, var_a / n_a, 0)
+        return variance_of_ratios(mean_b, var_mean_b, mean_a, var_mean_a, 0)
     else:
-        return var_b / n_b + var_a / n_a
+        return var_mean_b + var_mean_a
+
+
+def frequentist_dof(var_a, n_a, var_b, n_b) -> float:
+    # welch-satterthwaite approx, written in terms of the variance of each mean
+    var_mean_a = var_a / n_a
+    var_mean_b = var_b / n_b
+    var_sum = var_mean_b + var_mean_a
+    return (var_sum * var_sum) / (
+        var_mean_b * var_mean_b / (n_b - 1) + var_mean_a * var_mean_a / (n_a - 1)
+    )
 
 
 def frequentist_variance_relative_cuped(
     stat_a: RegressionAdjustedStatistic, stat_b: RegressionAdjustedStatistic
 ) -> float:
-    den_trt = stat_b.n * stat_a.unadjusted_mean**2
-    den_ctrl = stat_a.n * stat_a.unadjusted_mean**2
-    if den_trt == 0 or den_ctrl == 0:
+    mean_a_unadjusted = stat_a.unadjusted_mean
+    mean_a_unadjusted_2 = mean_a_unadjusted * mean_a_unadjusted
+    if mean_a_unadjusted_2 == 0 or stat_a.n == 0 or stat_b.n == 0:
         return 0  # avoid division by zero
     theta = stat_a.theta if stat_a.theta else 0
+    theta_2 = theta * theta
     num_trt = (
         stat_b.post_statistic.variance
-        + theta**2 * stat_b.pre_statistic.variance
+        + theta_2 * stat_b.pre_statistic.variance
         - 2 * theta * stat_b.covariance
     )
-    v_trt = num_trt / den_trt
-    const = -stat_b.post_statistic.mean
-    num_a = stat_a.post_statistic.variance * const**2 / (stat_a.post_statistic.mean**2)
-    num_b = 2 * theta * stat_a.covariance * const / stat_a.post_statistic.mean
-    num_c = theta**2 * stat_a.pre_statistic.variance
-    v_ctrl = (num_a + num_b + num_c) / den_ctrl
-    return v_trt + v_ctrl
+    post_mean_a = stat_a.post_statistic.mean
+    const = -stat_b.post_statistic.mean / post_mean_a
+    num_a = stat_a.post_statistic.variance * const * const
+    num_b = 2 * theta * stat_a.covariance * const
+    num_c = theta_2 * stat_a.pre_statistic.variance
+    num_ctrl = num_a + num_b + num_c
+    # both terms share the squared baseline mean in their denominators
+    return (num_trt / stat_b.n + num_ctrl / stat_a.n) / mean_a_unadjusted_2
 
 
 def frequentist_variance_relative_cuped_ratio(
     stat_a: RegressionAdjustedRatioStatistic, stat_b: RegressionAdjustedRatioStatistic
 ) -> float:
-    if stat_a.unadjusted_mean == 0 or stat_a.d_statistic_post.mean == 0:
+    mean_a_unadjusted = stat_a.unadjusted_mean
+    d_post_mean_a = stat_a.d_statistic_post.mean
+    if mean_a_unadjusted == 0 or d_post_mean_a == 0:
         return 0  # avoid division by zero
     g_abs = stat_b.mean - stat_a.mean
-    g_rel_den = np.abs(stat_a.unadjusted_mean)
-    nabla_ctrl_0_num = -(g_rel_den + g_abs) / stat_a.d_statistic_post.mean
-    nabla_ctrl_0_den = g_rel_den**2
-    nabla_ctrl_0 = nabla_ctrl_0_num / nabla_ctrl_0_den
-    nabla_ctrl_1_num = (
-        stat_a.m_statistic_post.mean * g_rel_den / stat_a.d_statistic_post.mean**2
-        + stat_a.m_statistic_post.mean * g_abs / stat_a.d_statistic_post.mean**2
+    g_rel_den = abs(mean_a_unadjusted)
+    g_rel_den_2 = g_rel_den * g_rel_den
+    nabla_ctrl_common = (g_rel_den + g_abs) / (d_post_mean_a * g_rel_den_2)
+    nabla_ctrl_0 = -nabla_ctrl_common
+    nabla_ctrl_1 = nabla_ctrl_common * stat_a.m_statistic_post.mean / d_post_mean_a
+    nabla_a_abs = stat_a.nabla
+    nabla_a = (
+        nabla_ctrl_0,
+        nabla_ctrl_1,
+        -float(nabla_a_abs[2]) / g_rel_den,
+        -float(nabla_a_abs[3]) / g_rel_den,
     )
-    nabla_ctrl_1_den = g_rel_den**2
-    nabla_ctrl_1 = nabla_ctrl_1_num / nabla_ctrl_1_den
-    nabla_a = np.array(
-        [
-            nabla_ctrl_0,
-            nabla_ctrl_1,
-            -stat_a.nabla[2] / g_rel_den,
-            -stat_a.nabla[3] / g_rel_den,
-        ]
-    )
-    nabla_b = stat_b.nabla / g_rel_den
+    # scale the treatment quadratic form instead of the gradient vector
+    var_a = _quadratic_form_4(nabla_a, stat_a.lambda_matrix.tolist())
+    var_b = _quadratic_form_4(stat_b.nabla.tolist(), stat_b.lambda_matrix.tolist())
+    return var_a / stat_a.n + var_b / (g_rel_den_2 * stat_b.n)
+
+
+def _quadratic_form_4(x: Sequence[float], m: Sequence[Sequence[float]]) -> float:
+    """x' m x for a length 4 vector and a 4x4 matrix, unrolled because NumPy
+    call overhead dominates for operands this small
+    """
+    x0, x1, x2, x3 = x
+    m0, m1, m2, m3 = m
     return (
-        nabla_a.T.dot(stat_a.lambda_matrix).dot(nabla_a) / stat_a.n
-        + nabla_b.T.dot(stat_b.lambda_matrix).dot(nabla_b) / stat_b.n
+        x0 * (m0[0] * x0 + m0[1] * x1 + m0[2] * x2 + m0[3] * x3)
+        + x1 * (m1[0] * x0 + m1[1] * x1 + m1[2] * x2 + m1[3] * x3)
+        + x2 * (m2[0] * x0 + m2[1] * x1 + m2[2] * x2 + m2[3] * x3)
+        + x3 * (m3[0] * x0 + m3[1] * x1 + m3[2] * x2 + m3[3] * x3)
     )
 
 
@@ -148,23 +192,27 @@ class TTest(BaseABTest):
         self.traffic_percentage = config.traffic_percentage
         self.total_users = config.total_users
         self.phase_length_days = config.phase_length_days
-
-    @property
-    def variance(self) -> float:
+        # the statistic types are settled by BaseABTest.__init__, so the
+        # variance formula can be chosen once here
         if (
             isinstance(self.stat_a, RegressionAdjustedStatistic)
             and isinstance(self.stat_b, RegressionAdjustedStatistic)
             and self.relative
         ):
-            return frequentist_variance_relative_cuped(self.stat_a, self.stat_b)
+            self._variance_fn: Callable[[], float] = partial(
+                frequentist_variance_relative_cuped, self.stat_a, self.stat_b
+            )
         elif (
             isinstance(self.stat_a, RegressionAdjustedRatioStatistic)
             and isinstance(self.stat_b, RegressionAdjustedRatioStatistic)
             and self.relative
         ):
-            return frequentist_variance_relative_cuped_ratio(self.stat_a, self.stat_b)
+            self._variance_fn = partial(
+                frequentist_variance_relative_cuped_ratio, self.stat_a, self.stat_b
+            )
         else:
-            return frequentist_variance(
+            self._variance_fn = partial(
+                frequentist_variance,
                 self.stat_a.variance,
                 self.stat_a.unadjusted_mean,
                 self.stat_a.n,
@@ -174,7 +222,11 @@ class TTest(BaseABTest):
                 self.relative,
             )
 
-    @property
+    @cached_property
+    def variance(self) -> float:
+        return self._variance_fn()
+
+    @cached_property
     def point_estimate(self) -> float:
         return frequentist_diff(
             self.stat_a.mean,
@@ -183,20 +235,21 @@ class TTest(BaseABTest):
             self.stat_a.unadjusted_mean,
         )
 
-    @property
+    @cached_property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @cached_property
     def critical_value(self) -> float:
-        return (self.point_estimate - self.test_value) / np.sqrt(self.variance)
+        return (self.point_estimate - self.test_value) / self.stddev
 
-    @property
+    @cached_property
     def dof(self) -> float:
-        # welch-satterthwaite approx
-        return pow(
-            self.stat_b.variance / self.stat_b.n + self.stat_a.variance / self.stat_a.n,
-            2,
-        ) / (
-            pow(self.stat_b.variance, 2) / (pow(self.stat_b.n, 2) * (self.stat_b.n - 1))
-            + pow(self.stat_a.variance, 2)
-            / (pow(self.stat_a.n, 2) * (self.stat_a.n - 1))
+        return frequentist_dof(
+            self.stat_a.variance,
+            self.stat_a.n,
+            self.stat_b.variance,
+            self.stat_b.n,
         )
 
     @property
@@ -217,18 +270,7 @@ class TTest(BaseABTest):
         """Return uninformative output when AB test analysis can't be performed
         adequately
         """
-        return FrequentistTestResult(
-            expected=0,
-            ci=[0, 0],
-            p_value=1,
-            uplift=Uplift(
-                dist="normal",
-                mean=0,
-                stddev=0,
-            ),
-            error_message=error_message,
-            p_value_error_message=p_value_error_message,
-        )
+        return frequentist_default_output(error_message, p_value_error_message)
 
     def compute_p_value(self) -> PValueResult:
         return PValueResult(
@@ -262,15 +304,16 @@ class TTest(BaseABTest):
             )
 
         p_value_result = self.compute_p_value()
+        point_estimate = self.point_estimate
 
         result = FrequentistTestResult(
-            expected=self.point_estimate,
+            expected=point_estimate,
             ci=self.confidence_interval,
             p_value=p_value_result.p_value,
             uplift=Uplift(
                 dist="normal",
-                mean=self.point_estimate,
-                stddev=np.sqrt(self.variance),
+                mean=point_estimate,
+                stddev=self.stddev,
             ),
             error_message=None,
             p_value_error_message=p_value_result.p_value_error_message,
@@ -289,17 +332,16 @@ class TTest(BaseABTest):
                 )
                 ci_lower = result.ci[0] * adjustment
                 ci_upper = result.ci[1] * adjustment
-                return FrequentistTestResult(
+                return replace(
+                    result,
                     expected=result.expected * adjustment,
                     ci=[ci_lower, ci_upper],
-                    p_value=result.p_value,
-                    uplift=Uplift(
-                        dist=result.uplift.dist,
+                    uplift=replace(
+                        result.uplift,
                         mean=result.uplift.mean * adjustment,
                         stddev=result.uplift.stddev * adjustment,
                     ),
                     error_message=None,
-                    p_value_error_message=result.p_value_error_message,
                 )
             else:
                 return self._default_output(NO_UNITS_IN_VARIATION_MESSAGE)
@@ -326,22 +368,22 @@ def two_sided_confidence_interval(
 class TwoSidedTTest(TTest):
     @property
     def p_value(self) -> float:
-        return 2 * (1 - t.cdf(abs(self.critical_value), self.dof))  # type: ignore
+        return float(2 * (1 - stdtr(self.dof, abs(self.critical_value))))
 
     @property
     def confidence_interval(self) -> List[float]:
-        halfwidth: float = t.ppf(1 - self.alpha / 2, self.dof) * np.sqrt(self.variance)
+        halfwidth = float(stdtrit(self.dof, 1 - self.alpha / 2)) * self.stddev
         return two_sided_confidence_interval(self.point_estimate, halfwidth)
 
 
 class OneSidedTreatmentGreaterTTest(TTest):
     @property
     def p_value(self) -> float:
-        return 1 - t.cdf(self.critical_value, self.dof)  # type: ignore
+        return float(1 - stdtr(self.dof, self.critical_value))
 
     @property
     def confidence_interval(self) -> List[float]:
-        halfwidth: float = t.ppf(1 - self.alpha, self.dof) * np.sqrt(self.variance)
+        halfwidth = float(stdtrit(self.dof, 1 - self.alpha)) * self.stddev
         return one_sided_confidence_interval(
             self.point_estimate, halfwidth, lesser=False
         )
@@ -350,21 +392,257 @@ class OneSidedTreatmentGreaterTTest(TTest):
 class OneSidedTreatmentLesserTTest(TTest):
     @property
     def p_value(self) -> float:
-        return t.cdf(self.critical_value, self.dof)  # type: ignore
+        return float(stdtr(self.dof, self.critical_value))
 
     @property
     def confidence_interval(self) -> List[float]:
-        halfwidth: float = t.ppf(1 - self.alpha, self.dof) * np.sqrt(self.variance)
+        halfwidth = float(stdtrit(self.dof, 1 - self.alpha)) * self.stddev
         return one_sided_confidence_interval(
             self.point_estimate, halfwidth, lesser=True
         )
 
 
+TTestAlternative = Literal["two-sided", "greater", "lesser"]
+
+
+@dataclass
+class FrequentistBatchResult:
+    point_estimate: np.ndarray
+    variance: np.ndarray
+    dof: np.ndarray
+    critical_value: np.ndarray
+    p_value: np.ndarray
+    halfwidth: np.ndarray
+
+
+def compute_results_batch(
+    mean_a: np.ndarray,
+    var_a: np.ndarray,
+    n_a: np.ndarray,
+    mean_b: np.ndarray,
+    var_b: np.ndarray,
+    n_b: np.ndarray,
+    config: FrequentistConfig = FrequentistConfig(),
+    alternative: TTestAlternative = "two-sided",
+    unadjusted_mean_a: Optional[np.ndarray] = None,
+    zero_variance: Optional[np.ndarray] = None,
+) -> FrequentistBatchResult:
+    """Fixed-horizon t-tests for many control/treatment pairs at once.
+    Element i of the returned arrays matches `.point_estimate`, `.variance`,
+    `.dof`, `.critical_value`, `.p_value` and the interval halfwidth of the
+    corresponding TwoSidedTTest or OneSidedTreatment(Greater|Lesser)TTest.
+    Pairs that `compute_result` would reject (zero baseline or zero
+    variance) get the uninformative default of a zero effect, variance,
+    dof and halfwidth and a p-value of 1. Relative CUPED variances and scaled
+    impact adjustments are not handled here.
+
+    Args:
+        mean_a, var_a, n_a: control means, variances and sample sizes
+        mean_b, var_b, n_b: treatment means, variances and sample sizes
+        config (FrequentistConfig): shared alpha, test value and difference type
+        alternative (TTestAlternative): which hypothesis test to run
+        unadjusted_mean_a: control means used as the relative denominator;
+            defaults to `mean_a`
+        zero_variance: per-pair flags for statistics that cannot be tested,
+            as given by `Statistic._has_zero_variance`; defaults to either
+            variance being non-positive
+    """
+    mean_a = np.asarray(mean_a, dtype=float)
+    var_a = np.asarray(var_a, dtype=float)
+    n_a = np.asarray(n_a, dtype=float)
+    mean_b = np.asarray(mean_b, dtype=float)
+    var_b = np.asarray(var_b, dtype=float)
+    n_b = np.asarray(n_b, dtype=float)
+    if unadjusted_mean_a is None:
+        unadjusted_mean_a = mean_a
+    else:
+        unadjusted_mean_a = np.asarray(unadjusted_mean_a, dtype=float)
+    relative = config.difference_type == "relative"
+
+    if zero_variance is None:
+        zero_variance = (var_a <= 0) | (var_b <= 0)
+    else:
+        zero_variance = np.asarray(zero_variance, dtype=bool)
+    valid = (mean_a != 0) & (unadjusted_mean_a != 0) & ~zero_variance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if relative:
+            point_estimate = (mean_b - mean_a) / unadjusted_mean_a
+        else:
+            point_estimate = mean_b - mean_a
+        variance = frequentist_variance(
+            var_a, unadjusted_mean_a, n_a, var_b, mean_b, n_b, relative
+        )
+        dof = np.asarray(frequentist_dof(var_a, n_a, var_b, n_b), dtype=float)
+        stddev = np.sqrt(variance)
+        critical_value = (point_estimate - config.test_value) / stddev
+        if alternative == "two-sided":
+            p_value = 2 * (1 - stdtr(dof, np.abs(critical_value)))
+            halfwidth = stdtrit(dof, 1 - config.alpha / 2) * stddev
+        elif alternative == "greater":
+            p_value = 1 - stdtr(dof, critical_value)
+            halfwidth = stdtrit(dof, 1 - config.alpha) * stddev
+        else:
+            p_value = stdtr(dof, critical_value)
+            halfwidth = stdtrit(dof, 1 - config.alpha) * stddev
+
+    return FrequentistBatchResult(
+        point_estimate=np.where(valid, point_estimate, 0),
+        variance=np.where(valid, variance, 0),
+        dof=np.where(valid, dof, 0),
+        critical_value=np.where(valid, critical_value, 0),
+        p_value=np.where(valid, p_value, 1),
+        halfwidth=np.where(valid, halfwidth, 0),
+    )
+
+
+class TTestBatch:
+    def __init__(
+        self,
+        stats_a: List[TestStatistic],
+        stats_b: List[TestStatistic],
+        config: FrequentistConfig = FrequentistConfig(),
+        alternative: TTestAlternative = "two-sided",
+    ):
+        """Fixed-horizon t-tests for many control/treatment pairs, stored as
+        one array per field so that every quantity is computed for all pairs
+        in a single vectorized pass. Element i matches the scalar TwoSidedTTest
+        or OneSidedTreatment(Greater|Lesser)TTest for `stats_a[i]` and
+        `stats_b[i]`, provided `TTestBatch.supports` holds for the pairs.
+
+        Args:
+            stats_a (List[Statistic]): the "control" or "baseline" statistics
+            stats_b (List[Statistic]): the "treatment" or "variation" statistics
+            config (FrequentistConfig): settings shared by all pairs
+            alternative (TTestAlternative): which hypothesis test to run
+        """
+        self.config = config
+        self.alternative: TTestAlternative = alternative
+        rows = [
+            (
+                stat_a.mean,
+                stat_a.unadjusted_mean,
+                stat_a.variance,
+                stat_a.n,
+                stat_b.mean,
+                stat_b.variance,
+                stat_b.n,
+            )
+            for stat_a, stat_b in zip(stats_a, stats_b)
+        ]
+        # statistics such as quantiles define their own rule for when they
+        # are too noisy to test, so use it rather than the variance sign
+        self.zero_variance = np.array(
+            [
+                stat_a._has_zero_variance or stat_b._has_zero_variance
+                for stat_a, stat_b in zip(stats_a, stats_b)
+            ],
+            dtype=bool,
+        )
+        (
+            self.mean_a,
+            self.unadjusted_mean_a,
+            self.var_a,
+            self.n_a,
+            self.mean_b,
+            self.var_b,
+            self.n_b,
+        ) = (
+            np.array(rows, dtype=float).reshape(-1, 7).T
+        )
+
+    @staticmethod
+    def supports(
+        stats_a: List[TestStatistic],
+        stats_b: List[TestStatistic],
+        config: FrequentistConfig,
+    ) -> bool:
+        """Whether the batch reproduces the scalar tests for these pairs;
+        relative CUPED variances and scaled impact need the scalar tests
+        """
+        if config.difference_type == "scaled":
+            return False
+        if config.difference_type == "relative":
+            return not any(
+                isinstance(
+                    stat,
+                    (RegressionAdjustedStatistic, RegressionAdjustedRatioStatistic),
+                )
+                for stat in stats_a + stats_b
+            )
+        return True
+
+    @cached_property
+    def result(self) -> FrequentistBatchResult:
+        return compute_results_batch(
+            self.mean_a,
+            self.var_a,
+            self.n_a,
+            self.mean_b,
+            self.var_b,
+            self.n_b,
+            config=self.config,
+            alternative=self.alternative,
+            unadjusted_mean_a=self.unadjusted_mean_a,
+            zero_variance=self.zero_variance,
+        )
+
+    @property
+    def p_values(self) -> np.ndarray:
+        return self.result.p_value
+
+    @property
+    def confidence_intervals(self) -> np.ndarray:
+        point_estimate = self.result.point_estimate
+        halfwidth = self.result.halfwidth
+        lower = point_estimate - halfwidth
+        upper = point_estimate + halfwidth
+        if self.alternative == "greater":
+            upper = np.full_like(upper, np.inf)
+        elif self.alternative == "lesser":
+            lower = np.full_like(lower, -np.inf)
+        return np.column_stack((lower, upper))
+
+    def compute_results(self) -> List[FrequentistTestResult]:
+        """Compute the test statistics for every pair, in the same form as
+        `TTest.compute_result`
+        """
+        baseline_zero = (self.mean_a == 0) | (self.unadjusted_mean_a == 0)
+        point_estimates = self.result.point_estimate.tolist()
+        stddevs = np.sqrt(self.result.variance).tolist()
+        p_values = self.p_values.tolist()
+        cis = self.confidence_intervals.tolist()
+        results = []
+        for i, point_estimate in enumerate(point_estimates):
+            error_message = None
+            if baseline_zero[i]:
+                error_message = BASELINE_VARIATION_ZERO_MESSAGE
+            elif self.zero_variance[i]:
+                error_message = ZERO_NEGATIVE_VARIANCE_MESSAGE
+            if error_message:
+                results.append(frequentist_default_output(error_message))
+            else:
+                results.append(
+                    FrequentistTestResult(
+                        expected=point_estimate,
+                        ci=cis[i],
+                        p_value=p_values[i],
+                        uplift=Uplift(
+                            dist="normal", mean=point_estimate, stddev=stddevs[i]
+                        ),
+                        error_message=None,
+                        p_value_error_message=None,
+                    )
+                )
+        return results
+
+
+@lru_cache(maxsize=256)
 def sequential_rho(alpha, sequential_tuning_parameter, two_sided=True) -> float:
     # eq 161 in https://arxiv.org/pdf/2103.06476v7.pdf
     alpha_arg = alpha if two_sided else 2 * alpha
-    return np.sqrt(
-        (-2 * np.log(alpha_arg) + np.log(-2 * np.log(alpha_arg) + 1))
+    log_alpha_arg = math.log(alpha_arg)
+    return math.sqrt(
+        (-2 * log_alpha_arg + math.log(-2 * log_alpha_arg + 1))
         / sequential_tuning_parameter
     )
 
@@ -375,12 +653,9 @@ def sequential_interval_halfwidth(
     if rho is None:
         rho = sequential_rho(alpha, sequential_tuning_parameter, two_sided=True)
     # eq 9 in Waudby-Smith et al. 2023 https://arxiv.org/pdf/2103.06476v7.pdf
-    return np.sqrt(s2) * np.sqrt(
-        (
-            (2 * (n * np.power(rho, 2) + 1))
-            * np.log(np.sqrt(n * np.power(rho, 2) + 1) / alpha)
-            / (np.power(n * rho, 2))
-        )
+    n_rho2 = n * rho * rho
+    return math.sqrt(s2) * math.sqrt(
+        2 * (n_rho2 + 1) * math.log(math.sqrt(n_rho2 + 1) / alpha) / (n * n_rho2)
     )
 
 
@@ -390,10 +665,11 @@ def sequential_interval_halfwidth_one_sided(
     if rho is None:
         rho = sequential_rho(alpha, sequential_tuning_parameter, two_sided=False)
     # eq 134 in https://arxiv.org/pdf/2103.06476v7.pdf
+    n_rho2 = n * rho * rho
     part_1 = s2
-    part_2 = 2 * (n * np.power(rho, 2) + 1) / (np.power(n * rho, 2))
-    part_3 = np.log(1 + np.sqrt(n * np.power(rho, 2) + 1) / (2 * alpha))
-    return np.sqrt(part_1 * part_2 * part_3)
+    part_2 = 2 * (n_rho2 + 1) / (n * n_rho2)
+    part_3 = math.log(1 + math.sqrt(n_rho2 + 1) / (2 * alpha))
+    return math.sqrt(part_1 * part_2 * part_3)
 
 
 class SequentialTTest(TTest):
@@ -403,20 +679,21 @@ class SequentialTTest(TTest):
         stat_b: TestStatistic,
         config: SequentialConfig = SequentialConfig(),
     ):
-        config_dict = asdict(config)
-        super().__init__(stat_a, stat_b, FrequentistConfig(**config_dict))
-        self.sequential_tuning_parameter = config_dict.pop(
-            "sequential_tuning_parameter"
+        super().__init__(stat_a, stat_b, config)
+        self.sequential_tuning_parameter = config.sequential_tuning_parameter
+        self._config_rho = config.rho
+
+    @cached_property
+    def rho(self) -> float:
+        if self._config_rho is not None:
+            return self._config_rho
+        return sequential_rho(
+            self.alpha,
+            self.sequential_tuning_parameter,
+            two_sided=not self.sequential_one_sided_test,
         )
-        self.rho = config_dict.pop("rho", None)
-        if self.rho is None:
-            self.rho = sequential_rho(
-                self.alpha,
-                self.sequential_tuning_parameter,
-                two_sided=not self.sequential_one_sided_test,
-            )
 
-    @property
+    @cached_property
     def n(self) -> float:
         return self.stat_a.n + self.stat_b.n
 
@@ -446,14 +723,14 @@ class SequentialTwoSidedTTest(SequentialTTest):
     def p_value(self) -> float:
         # eq 155 in https://arxiv.org/pdf/2103.06476v7.pdf
         # slight reparameterization for this quantity below
-        st2 = (
-            np.power(self.point_estimate - self.test_value, 2)
-            * self.n
-            / (self.variance)
-        )
-        tr2p1 = self.n * np.power(self.rho, 2) + 1
-        evalue = np.exp(np.power(self.rho, 2) * st2 / (2 * tr2p1)) / np.sqrt(tr2p1)
-        return min(1 / evalue, 1)
+        diff = self.point_estimate - self.test_value
+        st2 = diff * diff * self.n / self.variance
+        rho2 = self.rho * self.rho
+        tr2p1 = self.n * rho2 + 1
+        # work with log(evalue) so that large evalues underflow the p-value to
+        # 0 rather than overflowing exp
+        log_evalue = rho2 * st2 / (2 * tr2p1) - 0.5 * math.log(tr2p1)
+        return min(math.exp(-log_evalue), 1)
 
 
 class SequentialOneSidedTreatmentLesserTTest(SequentialTTest):
@@ -483,85 +760,51 @@ class SequentialOneSidedTreatmentLesserTTest(SequentialTTest):
         return None
 
     def compute_p_value(self) -> PValueResult:
-        rho = self.rho
-        difference_type = (
-            "relative" if self.relative else "scaled" if self.scaled else "absolute"
-        )
-        tol = 1e-6
-        max_iters = 100
         min_alpha = 1e-5
         max_alpha = 0.4999
-        this_config = SequentialConfig(
-            difference_type=difference_type, alpha=min_alpha, rho=rho
-        )
-        this_test = (
-            SequentialOneSidedTreatmentLesserTTest
-            if self.lesser
-            else SequentialOneSidedTreatmentGreaterTTest
+        # only the halfwidth depends on alpha, so compute everything else once
+        n = self.n
+        s2 = self.variance * n
+        sequential_tuning_parameter = self.sequential_tuning_parameter
+        rho = self.rho
+        # flip signs for the greater test so that a positive margin means the
+        # interval bound is on the wrong side of zero for this alpha
+        signed_point_estimate = (
+            self.point_estimate if self.lesser else -self.point_estimate
         )
-        ci_index = 1 if self.lesser else 0
-        this_ci_small = this_test(
-            self.stat_a, self.stat_b, this_config
-        ).confidence_interval
+
+        def margin(alpha: float) -> float:
+            return signed_point_estimate + sequential_interval_halfwidth_one_sided(
+                s2, n, sequential_tuning_parameter, alpha, rho
+            )
+
         # smaller alpha => bigger confidence interval;
-        if self.lesser:
-            if this_ci_small[ci_index] < 0:
-                return PValueResult(
-                    p_value=min_alpha,
-                    p_value_error_message=None,
-                )
-            this_config.alpha = max_alpha
-            # bigger alpha => smaller confidence interval;
-            this_ci_big = this_test(
-                self.stat_a, self.stat_b, this_config
-            ).confidence_interval
-            if this_ci_big[ci_index] > 0:
-                return PValueResult(
-                    p_value=max_alpha,
-                    p_value_error_message=None,
-                )
-        else:
-            if this_ci_small[ci_index] > 0:
-                return PValueResult(
-                    p_value=min_alpha,
-                    p_value_error_message=None,
-                )
-            this_config.alpha = max_alpha
-            # bigger alpha => smaller confidence interval;
-            this_ci_big = this_test(
-                self.stat_a, self.stat_b, this_config
-            ).confidence_interval
-            if this_ci_big[ci_index] < 0:
-                return PValueResult(
-                    p_value=max_alpha,
-                    p_value_error_message=None,
-                )
-        iters = 0
-        this_alpha = 0.5 * (min_alpha + max_alpha)
-        diff = 0
-        for _ in range(max_iters):
-            this_config.alpha = this_alpha
-            this_ci = this_test(
-                self.stat_a, self.stat_b, this_config
-            ).confidence_interval
-            diff = this_ci[ci_index] - 0
-            if self.lesser:
-                if diff > 0:
-                    min_alpha = this_alpha
-                else:
-                    max_alpha = this_alpha
-            else:
-                if diff < 0:
-                    min_alpha = this_alpha
-                else:
-                    max_alpha = this_alpha
-            this_alpha = 0.5 * (min_alpha + max_alpha)
-            if abs(diff) < tol:
-                break
-        converged = abs(diff) < tol and iters != max_iters
-        if converged:
+        if margin(min_alpha) < 0:
+            return PValueResult(
+                p_value=min_alpha,
+                p_value_error_message=None,
+            )
+        # bigger alpha => smaller confidence interval;
+        if margin(max_alpha) > 0:
+            return PValueResult(
+                p_value=max_alpha,
+                p_value_error_message=None,
+            )
+        # the margin decreases monotonically in alpha and changes sign on
+        # [min_alpha, max_alpha], so Brent's method is guaranteed a bracket;
+        # brentq's default relative tolerance keeps small p-values accurate
+        p_value, root_result = brentq(
+            margin,
+            min_alpha,
+            max_alpha,
+            xtol=1e-12,
+            maxiter=100,
+            full_output=True,
+            disp=False,
+        )
+        if root_result.converged:
             return PValueResult(
-                p_value=this_alpha,
+                p_value=p_value,
                 p_value_error_message=None,
             )
         else:
@@ -2,7 +2,7 @@ from dataclasses import asdict
 import re
 import traceback
 import copy
-from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
 
 import pandas as pd
 import numpy as np
@@ -39,6 +39,8 @@ from gbstats.frequentist.tests import (
     OneSidedTreatmentLesserTTest,
     SequentialOneSidedTreatmentLesserTTest,
     SequentialOneSidedTreatmentGreaterTTest,
+    TTestAlternative,
+    TTestBatch,
 )
 
 from gbstats.models.results import (
@@ -211,6 +213,18 @@ def reduce_dimensionality(
     return pd.DataFrame(newrows)
 
 
+def get_frequentist_config(
+    row: pd.Series, analysis: AnalysisSettingsForStatsEngine
+) -> FrequentistConfig:
+    return FrequentistConfig(
+        total_users=int(row["total_users"]),
+        traffic_percentage=analysis.traffic_percentage,
+        phase_length_days=analysis.phase_length_days,
+        difference_type=analysis.difference_type,
+        alpha=analysis.alpha,
+    )
+
+
 def get_configured_test(
     row: pd.Series,
     test_index: int,
@@ -254,10 +268,7 @@ def get_configured_test(
             else:
                 return SequentialTwoSidedTTest(stat_a, stat_b, sequential_config)
         else:
-            config = FrequentistConfig(
-                **base_config,
-                alpha=analysis.alpha,
-            )
+            config = get_frequentist_config(row, analysis)
             if analysis.one_sided_intervals:
                 if metric.inverse:
                     return OneSidedTreatmentGreaterTTest(stat_a, stat_b, config)
@@ -284,6 +295,45 @@ def get_configured_test(
         )
 
 
+# fixed-horizon t-tests that can be run for all variations at once
+BATCH_TTEST_ALTERNATIVES: Dict[type, TTestAlternative] = {
+    TwoSidedTTest: "two-sided",
+    OneSidedTreatmentGreaterTTest: "greater",
+    OneSidedTreatmentLesserTTest: "lesser",
+}
+# below this many variations the per-test loop is faster than the batch's
+# fixed array setup cost (break-even measured at ~6 variations)
+MIN_BATCH_TTEST_SIZE = 8
+
+
+def compute_test_results(
+    row: pd.Series,
+    tests: List[
+        Union[
+            EffectBayesianABTest,
+            SequentialTwoSidedTTest,
+            TwoSidedTTest,
+            OneSidedTreatmentGreaterTTest,
+            OneSidedTreatmentLesserTTest,
+            SequentialOneSidedTreatmentLesserTTest,
+            SequentialOneSidedTreatmentGreaterTTest,
+        ]
+    ],
+    analysis: AnalysisSettingsForStatsEngine,
+) -> Sequence[Union[BayesianTestResult, FrequentistTestResult]]:
+    test_types = {type(test) for test in tests}
+    if len(tests) >= MIN_BATCH_TTEST_SIZE and len(test_types) == 1:
+        alternative = BATCH_TTEST_ALTERNATIVES.get(test_types.pop())
+        if alternative is not None:
+            stats_a = [test.stat_a for test in tests]
+            stats_b = [test.stat_b for test in tests]
+            config = get_frequentist_config(row, analysis)
+            if TTestBatch.supports(stats_a, stats_b, config):
+                batch = TTestBatch(stats_a, stats_b, config, alternative)
+                return batch.compute_results()
+    return [test.compute_result() for test in tests]
+
+
 def decision_making_conditions(metric, analysis):
     return (
         metric.business_metric_type
@@ -333,13 +383,13 @@ def analyze_metric_df(
 
     def analyze_row(s: pd.Series) -> pd.Series:
         s = s.copy()
-        # Loop through each non-baseline variation and run an analysis
-        for i in range(1, num_variations):
-            # Run analysis of baseline vs variation
-            test = get_configured_test(
-                row=s, test_index=i, analysis=analysis, metric=metric
-            )
-            res = test.compute_result()
+        # Run analysis of baseline vs each non-baseline variation
+        tests = [
+            get_configured_test(row=s, test_index=i, analysis=analysis, metric=metric)
+            for i in range(1, num_variations)
+        ]
+        results = compute_test_results(s, tests, analysis)
+        for i, (test, res) in enumerate(zip(tests, results), start=1):
             if decision_making_conditions(metric, analysis):
                 s[f"v{i}_decision_making_conditions"] = True
                 config = BaseConfig(
@@ -13,6 +13,7 @@ from gbstats.frequentist.tests import (
     frequentist_variance,
     frequentist_variance_relative_cuped,
     sequential_interval_halfwidth,
+    sequential_rho,
 )
 from gbstats.bayesian.tests import GaussianPrior
 from gbstats.models.tests import BaseConfig
@@ -79,6 +80,17 @@ class MidExperimentPower:
         self.prior_effect = power_config.prior_effect
         self.sequential = power_config.sequential
         self.sequential_tuning_parameter = power_config.sequential_tuning_parameter
+        # rho does not depend on the sample size, so compute it once rather
+        # than on every power evaluation in the scaling factor search
+        self.rho = (
+            sequential_rho(
+                self.alpha / self.num_tests,
+                self.sequential_tuning_parameter,
+                two_sided=True,
+            )
+            if self.sequential
+            else None
+        )
 
     def _has_zero_variance(self) -> bool:
         """Check if any variance is 0 or negative"""
@@ -227,6 +239,7 @@ class MidExperimentPower:
                     n_total,
                     self.sequential_tuning_parameter,
                     self.alpha / self.num_tests,
+                    self.rho,
                 )
             else:
                 halfwidth = self.multiplier * adjusted_variance**0.5
@@ -16,12 +16,15 @@ from gbstats.frequentist.tests import (
     OneSidedTreatmentLesserTTest,
     SequentialOneSidedTreatmentGreaterTTest,
     SequentialOneSidedTreatmentLesserTTest,
+    TTestBatch,
+    compute_results_batch,
 )
 from gbstats.models.statistics import (
     ProportionStatistic,
     RegressionAdjustedStatistic,
     SampleMeanStatistic,
     RegressionAdjustedRatioStatistic,
+    QuantileStatistic,
 )
 from gbstats.models.tests import Uplift
 
@@ -478,7 +481,7 @@ class TestSequentialOneSidedGreaterTTest(TestCase):
                     dist="normal", mean=0.23437666666666668, stddev=0.12983081254184736
                 ),
                 error_message=None,
-                p_value=0.46316491943359384,
+                p_value=0.46304738502669796,
                 p_value_error_message=None,
             )
         )
@@ -486,6 +489,20 @@ class TestSequentialOneSidedGreaterTTest(TestCase):
             _round_result_dict(result_dict), _round_result_dict(expected_rounded_dict)
         )
 
+    def test_small_p_value_matches_analytic_inverse(self):
+        test = SequentialOneSidedTreatmentGreaterTTest(
+            ProportionStatistic(sum=1400, n=3000),
+            ProportionStatistic(sum=1580, n=3000),
+            SequentialConfig(difference_type="absolute"),
+        )
+        p_value = test.compute_p_value().p_value
+        # invert eq 134 in https://arxiv.org/pdf/2103.06476v7.pdf for alpha
+        n_rho2 = test.n * test.rho**2
+        scale = test.variance * 2 * (n_rho2 + 1) / n_rho2
+        expected = np.sqrt(n_rho2 + 1) / (2 * np.expm1(test.point_estimate**2 / scale))
+        self.assertLess(expected, 1e-3)
+        self.assertAlmostEqual(p_value / expected, 1, places=8)
+
 
 class TestSequentialOneSidedLesserTTest(TestCase):
     def setUp(self):
@@ -539,5 +556,181 @@ class TestSequentialOneSidedLesserTTest(TestCase):
         )
 
 
+class TestComputeResultsBatch(TestCase):
+    def setUp(self):
+        self.stats_a = [
+            SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=3407),
+            ProportionStatistic(sum=14, n=28),
+            SampleMeanStatistic(sum=0, sum_squares=0, n=100),
+        ]
+        self.stats_b = [
+            SampleMeanStatistic(sum=2422.7, sum_squares=134698.29, n=3461),
+            ProportionStatistic(sum=16, n=30),
+            SampleMeanStatistic(sum=10, sum_squares=20, n=100),
+        ]
+
+    def _run_batch(self, config, alternative):
+        return compute_results_batch(
+            mean_a=np.array([s.mean for s in self.stats_a]),
+            var_a=np.array([s.variance for s in self.stats_a]),
+            n_a=np.array([s.n for s in self.stats_a]),
+            mean_b=np.array([s.mean for s in self.stats_b]),
+            var_b=np.array([s.variance for s in self.stats_b]),
+            n_b=np.array([s.n for s in self.stats_b]),
+            config=config,
+            alternative=alternative,
+        )
+
+    def test_batch_matches_scalar_tests(self):
+        test_classes = {
+            "two-sided": TwoSidedTTest,
+            "greater": OneSidedTreatmentGreaterTTest,
+            "lesser": OneSidedTreatmentLesserTTest,
+        }
+        for difference_type in ["relative", "absolute"]:
+            config = FrequentistConfig(difference_type=difference_type)
+            for alternative, test_class in test_classes.items():
+                batch = self._run_batch(config, alternative)
+                # the zero baseline pair is rejected in every field
+                self.assertEqual(batch.dof[2], 0)
+                self.assertEqual(batch.critical_value[2], 0)
+                for i, (stat_a, stat_b) in enumerate(zip(self.stats_a, self.stats_b)):
+                    result = test_class(stat_a, stat_b, config).compute_result()
+                    self.assertAlmostEqual(
+                        batch.point_estimate[i], result.expected, places=DECIMALS
+                    )
+                    self.assertAlmostEqual(
+                        batch.p_value[i], result.p_value, places=DECIMALS
+                    )
+                    if alternative != "lesser":
+                        self.assertAlmostEqual(
+                            batch.point_estimate[i] - batch.halfwidth[i],
+                            result.ci[0],
+                            places=DECIMALS,
+                        )
+                    if alternative != "greater":
+                        self.assertAlmostEqual(
+                            batch.point_estimate[i] + batch.halfwidth[i],
+                            result.ci[1],
+                            places=DECIMALS,
+                        )
+
+
+class TestTTestBatch(TestCase):
+    def setUp(self):
+        stat_a_ra = RegressionAdjustedStatistic(
+            n=3000,
+            post_statistic=SampleMeanStatistic(
+                sum=1396.87, sum_squares=52377.9767, n=3000
+            ),
+            pre_statistic=SampleMeanStatistic(sum=16.87, sum_squares=527.9767, n=3000),
+            post_pre_sum_of_products=1,
+            theta=None,
+        )
+        stat_b_ra = RegressionAdjustedStatistic(
+            n=3461,
+            post_statistic=SampleMeanStatistic(
+                sum=2422.7, sum_squares=134698.29, n=3461
+            ),
+            pre_statistic=SampleMeanStatistic(sum=22.7, sum_squares=1348.29, n=3461),
+            post_pre_sum_of_products=1,
+            theta=None,
+        )
+        self.pairs = [
+            (
+                SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=3407),
+                SampleMeanStatistic(sum=2422.7, sum_squares=134698.29, n=3461),
+            ),
+            (ProportionStatistic(sum=14, n=28), ProportionStatistic(sum=16, n=30)),
+            (
+                SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=2),
+                SampleMeanStatistic(sum=2422.7, sum_squares=134698.29, n=3461),
+            ),
+            (stat_a_ra, stat_b_ra),
+            # too few events for the 90th percentile, despite positive variance
+            (
+                QuantileStatistic(
+                    n=3,
+                    n_star=3,
+                    nu=0.9,
+                    quantile_hat=7.0,
+                    quantile_lower=5.0,
+                    quantile_upper=9.0,
+                ),
+                QuantileStatistic(
+                    n=3,
+                    n_star=3,
+                    nu=0.9,
+                    quantile_hat=8.0,
+                    quantile_lower=6.0,
+                    quantile_upper=10.0,
+                ),
+            ),
+            (
+                QuantileStatistic(
+                    n=2000,
+                    n_star=2000,
+                    nu=0.9,
+                    quantile_hat=7.0,
+                    quantile_lower=6.8,
+                    quantile_upper=7.2,
+                ),
+                QuantileStatistic(
+                    n=2100,
+                    n_star=2100,
+                    nu=0.9,
+                    quantile_hat=7.3,
+                    quantile_lower=7.1,
+                    quantile_upper=7.5,
+                ),
+            ),
+        ]
+
+    def test_batch_matches_scalar_tests(self):
+        config = FrequentistConfig(difference_type="absolute")
+        test_classes = {
+            "two-sided": TwoSidedTTest,
+            "greater": OneSidedTreatmentGreaterTTest,
+            "lesser": OneSidedTreatmentLesserTTest,
+        }
+        for alternative, test_class in test_classes.items():
+            tests = [test_class(a, b, config) for a, b in self.pairs]
+            batch = TTestBatch(
+                [test.stat_a for test in tests],
+                [test.stat_b for test in tests],
+                config,
+                alternative,
+            )
+            for test, batch_result in zip(tests, batch.compute_results()):
+                self.assertDictEqual(
+                    _round_result_dict(asdict(batch_result)),
+                    _round_result_dict(asdict(test.compute_result())),
+                )
+
+    def test_supports(self):
+        stats_a = [a for a, _ in self.pairs]
+        stats_b = [b for _, b in self.pairs]
+        self.assertTrue(
+            TTestBatch.supports(
+                stats_a, stats_b, FrequentistConfig(difference_type="absolute")
+            )
+        )
+        self.assertFalse(
+            TTestBatch.supports(
+                stats_a, stats_b, FrequentistConfig(difference_type="relative")
+            )
+        )
+        self.assertTrue(
+            TTestBatch.supports(
+                stats_a[:3], stats_b[:3], FrequentistConfig(difference_type="relative")
+            )
+        )
+        self.assertFalse(
+            TTestBatch.supports(
+                stats_a[:3], stats_b[:3], FrequentistConfig(difference_type="scaled")
+            )
+        )
+
+
 if __name__ == "__main__":
     unittest_main()